@@ -19,7 +19,7 @@ optimal conditions for fast-charging lithium-ion batteries."""
 # IMPORTS
 # =============================================================================
 
-import importlib_metadata
+from importlib import metadata
 
 from . import datasets
 from .base import MapSpline
@@ -54,8 +54,8 @@ NAME = "galpynostatic"
 
 DOC = __doc__
 
-VERSION = importlib_metadata.version(NAME)
+VERSION = metadata.version(NAME)
 
 __version__ = tuple(VERSION.split("."))
 
-del importlib_metadata
+del metadata
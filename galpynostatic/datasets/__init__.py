@@ -33,8 +33,8 @@ References
 # IMPORTS
 # ============================================================================
 
-import os
-import pathlib
+import functools
+import importlib.resources
 
 import pandas as pd
 
@@ -42,13 +42,20 @@ import pandas as pd
 # CONSTANTS
 # ============================================================================
 
-PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
+PATH = importlib.resources.files(__package__)
 
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=None)
+def _read_dataset(geometry):
+    """Parse the geometry dataset only once per process."""
+    with importlib.resources.as_file(PATH / f"{geometry}.csv") as path:
+        return pd.read_csv(path, dtype=float, engine="c", memory_map=True)
+
+
 def load_dataset(geometry="spherical"):
     """Galvanostatic map for a cut-off potential of 150 mV.
 
@@ -67,8 +74,13 @@ def load_dataset(geometry="spherical"):
     ------
     ValueError
         If the geometry is not `"spherical"`, `"cylindrical"` or `"planar"`.
+
+    Notes
+    -----
+    The datasets are parsed once and kept in memory, each call returns a copy
+    so the cached data can not be modified by the caller.
     """
     try:
-        return pd.read_csv(PATH / f"{geometry}.csv")
+        return _read_dataset(geometry).copy()
     except FileNotFoundError:
         raise ValueError(f"{geometry} is not a valid geometry.")
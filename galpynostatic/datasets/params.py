@@ -32,8 +32,8 @@ References
 # IMPORTS
 # ============================================================================
 
-import os
-import pathlib
+import functools
+import importlib.resources
 
 import yaml
 
@@ -41,7 +41,19 @@ import yaml
 # CONSTANTS
 # ============================================================================
 
-PATH = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
+PATH = importlib.resources.files(__package__)
+
+# ============================================================================
+# FUNCTIONS
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=None)
+def _read_materials():
+    """Parse the materials parameters only once per process."""
+    with (PATH / "params.yml").open("r") as fparams:
+        return yaml.safe_load(fparams)
+
 
 # ============================================================================
 # CLASSES
@@ -66,11 +78,8 @@ class Electrode:
     """
 
     def __init__(self, material):
-        with open(PATH / "params.yml", "r") as fparams:
-            materials = yaml.load(fparams, Loader=yaml.FullLoader)
-
         try:
-            self.material = materials[material]
+            self.material = dict(_read_materials()[material])
         except KeyError:
             raise ValueError(
                 f"params are not provided for {material} material."
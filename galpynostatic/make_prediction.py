@@ -57,7 +57,40 @@ VALUE_ERROR_MESSAGE = (
 # ============================================================================
 
 
-def optimal_charging_rate(greg, c0=1.0, loaded=0.8, **kwargs):
+def _optimal_charging_rate_brentq(greg, loaded, **kwargs):
+    """Find the optimal C-rate as a root in the log(C-rate) axis."""
+    logell_0 = logell(1.0, greg.d, greg.z, greg.dcoeff_)
+    logxi_0 = logxi(1.0, greg.dcoeff_, greg.k0_, greg.z)
+
+    # log(ell) grows and log(Xi) decreases with the log(C-rate), so the map
+    # limits in both axes bound the log(C-rate) values inside the map
+    lower = max(
+        greg._map.logells_[0] - logell_0, 2 * (logxi_0 - greg._map.logxis_[-1])
+    )
+    upper = min(
+        greg._map.logells_[-1] - logell_0, 2 * (logxi_0 - greg._map.logxis_[0])
+    )
+
+    if lower >= upper:
+        raise ValueError(VALUE_ERROR_MESSAGE)
+
+    def objfunc(logcrate):
+        return (
+            greg._map.soc(logell_0 + logcrate, logxi_0 - 0.5 * logcrate)
+            - loaded
+        )
+
+    try:
+        optimal_logcrate = scipy.optimize.brentq(
+            objfunc, lower, upper, **kwargs
+        )
+    except (RuntimeError, ValueError):
+        raise ValueError(VALUE_ERROR_MESSAGE)
+
+    return 10.0**optimal_logcrate
+
+
+def optimal_charging_rate(greg, c0=1.0, loaded=0.8, method="newton", **kwargs):
     r"""Predict the optimal C-rate to reach a desired SOC.
 
     The default parameters of this function predict the C-rate required to
@@ -68,16 +101,24 @@ def optimal_charging_rate(greg, c0=1.0, loaded=0.8, **kwargs):
     greg : galpynostatic.model.GalvanostaticRegressor
         An already fitted GalvanostaticRegressor.
 
-    c0 : float, default=4.0
+    c0 : float, default=1.0
         An initial estimate of the optimal charging rate that should be
-        somewhere near the actual prediction.
+        somewhere near the actual prediction, only used when `method` is
+        `"newton"`.
 
     loaded : float, default=0.8
         Desired maximum SOC, between 0 and 1.
 
+    method : str, default="newton"
+        The root finding method. With `"newton"` the secant method is used
+        starting from `c0`. With `"brentq"` the root of the maximum SOC is
+        bracketed between the C-rates that reach the limits of the map, so no
+        initial estimate is needed and `c0` is ignored.
+
     **kwargs
         Additional keyword arguments that are passed and are documented in
-        ``scipy.optimize.newton``.
+        ``scipy.optimize.brentq`` or ``scipy.optimize.newton``, depending on
+        the `method`.
 
     Returns
     -------
@@ -93,18 +134,25 @@ def optimal_charging_rate(greg, c0=1.0, loaded=0.8, **kwargs):
     ------
     ValueError
         If the material does not meet the defined criterion given the input
-        parameters or map constraints.
+        parameters or map constraints, or if the `method` is not valid.
     """
+    if method == "brentq":
+        c_rate = _optimal_charging_rate_brentq(greg, loaded, **kwargs)
 
-    def objfunc(cr, greg, loaded):
-        return greg.predict(np.reshape([cr], (-1, 1)))[0] - loaded
+    elif method == "newton":
 
-    try:
-        c_rate = scipy.optimize.newton(
-            objfunc, c0, args=(greg, loaded), **kwargs
-        )
-    except (RuntimeError, ValueError):
-        raise ValueError(VALUE_ERROR_MESSAGE)
+        def objfunc(cr, greg, loaded):
+            return greg._soc(cr, greg.dcoeff_, greg.k0_) - loaded
+
+        try:
+            c_rate = scipy.optimize.newton(
+                objfunc, c0, args=(greg, loaded), **kwargs
+            )
+        except (RuntimeError, ValueError):
+            raise ValueError(VALUE_ERROR_MESSAGE)
+
+    else:
+        raise ValueError(f"{method} is not a valid method.")
 
     if greg.dcoeff_err_ is None or greg.k0_err_ is None:
         return c_rate
@@ -119,8 +167,36 @@ def optimal_charging_rate(greg, c0=1.0, loaded=0.8, **kwargs):
         return (c_rate, c_rate_err)
 
 
+def _optimal_particle_size_brentq(greg, loaded, c_rate, **kwargs):
+    """Find the optimal particle size as a root in the log(ell) axis."""
+    optimal_logxi = logxi(c_rate, greg.dcoeff_, greg.k0_, greg.z)
+
+    if not greg._map._mask_logxi(optimal_logxi):
+        raise ValueError(VALUE_ERROR_MESSAGE)
+
+    def objfunc(optimal_logell):
+        return greg._map.soc(optimal_logell, optimal_logxi) - loaded
+
+    try:
+        optimal_logell = scipy.optimize.brentq(
+            objfunc, greg._map.logells_[0], greg._map.logells_[-1], **kwargs
+        )
+    except (RuntimeError, ValueError):
+        raise ValueError(VALUE_ERROR_MESSAGE)
+
+    return np.sqrt(
+        3600 * greg.z * greg.dcoeff_ * 10.0**optimal_logell / c_rate
+    )
+
+
 def optimal_particle_size(
-    greg, d0=1e-4, loaded=0.8, c_rate=4.0, cm_to=10_000, **kwargs
+    greg,
+    d0=1e-4,
+    loaded=0.8,
+    c_rate=4.0,
+    cm_to=10_000,
+    method="newton",
+    **kwargs,
 ):
     r"""Predict the optimal electrode particle size to charge in certain time.
 
@@ -136,7 +212,8 @@ def optimal_particle_size(
 
     d0 : float, default=1e-4
         An initial estimate of the optimal particle size rate that should be
-        somewhere near the actual prediction.
+        somewhere near the actual prediction, only used when `method` is
+        `"newton"`.
 
     loaded : float, default=0.8
         Desired maximum SOC value, between 0 and 1.
@@ -148,9 +225,17 @@ def optimal_particle_size(
         A factor to convert from cm to another unit, in the default case to
         microns.
 
+    method : str, default="newton"
+        The root finding method. With `"newton"` the secant method is used
+        starting from `d0`. With `"brentq"` the root of the maximum SOC is
+        bracketed between the :math:`\ell` limits of the map, where it is
+        monotone for a given :math:`\Xi` value, so no initial estimate is
+        needed and `d0` is ignored.
+
     **kwargs
         Additional keyword arguments that are passed and are documented in
-        ``scipy.optimize.newton``.
+        ``scipy.optimize.brentq`` or ``scipy.optimize.newton``, depending on
+        the `method`.
 
     Returns
     -------
@@ -165,32 +250,41 @@ def optimal_particle_size(
     ------
     ValueError
         If the material does not meet the defined criterion given the input
-        parameters or map constraints.
+        parameters or map constraints, or if the `method` is not valid.
     """
+    if method == "brentq":
+        particle_size = _optimal_particle_size_brentq(
+            greg, loaded, c_rate, **kwargs
+        )
 
-    def objfunc(d, greg, c_rate, loaded):
-        greg.d = d
-        return greg.predict(np.reshape([c_rate], (-1, 1)))[0] - loaded
+    elif method == "newton":
 
-    try:
-        particle_size = np.abs(
-            scipy.optimize.newton(
-                objfunc, d0, args=(greg, c_rate, loaded), **kwargs
+        optimal_logxi = logxi(c_rate, greg.dcoeff_, greg.k0_, greg.z)
+
+        def objfunc(d, greg, c_rate, loaded):
+            optimal_logell = logell(c_rate, d, greg.z, greg.dcoeff_)
+            return greg._map_soc(optimal_logell, optimal_logxi) - loaded
+
+        try:
+            particle_size = np.abs(
+                scipy.optimize.newton(
+                    objfunc, d0, args=(greg, c_rate, loaded), **kwargs
+                )
             )
-        )
-    except (RuntimeError, ValueError):
-        raise ValueError(VALUE_ERROR_MESSAGE)
+        except (RuntimeError, ValueError):
+            raise ValueError(VALUE_ERROR_MESSAGE)
+
+    else:
+        raise ValueError(f"{method} is not a valid method.")
 
     if greg.dcoeff_err_ is None:
         return cm_to * particle_size
 
     else:
-        optimal_ell = 10.0 ** logell(
-            c_rate, particle_size, greg.z, greg.dcoeff_
-        )
-        factor = np.sqrt((3600 * greg.z * optimal_ell) / c_rate)
+        # the particle size is proportional to the square root of the
+        # diffusion coefficient at a fixed optimal ell
         particle_size_err = (
-            factor * greg.dcoeff_err_ / (2 * np.sqrt(greg.dcoeff_))
+            particle_size * greg.dcoeff_err_ / (2 * greg.dcoeff_)
         )
 
         return (cm_to * particle_size, cm_to * particle_size_err)
@@ -44,7 +44,9 @@ def bmxfc(greg, c_rate=4, loaded=0.8, full_output=False, **kwargs):
         An already fitted GalvanostaticRegressor model or a dict containing
         the following keys with float values definened: `d` in :math:`cm`
         (particle size), `dcoeff_` in :math:`cm^2/s` (diffusion coefficient)
-        and `k0_` in :math:`cm/s` (kinetic rate constant).
+        and `k0_` in :math:`cm/s` (kinetic rate constant). In the dict case,
+        the values can also be broadcastable arrays to benchmark many
+        materials at once, but only with `full_output=False`.
 
     c_rate : int or float, default=4
         Galvanostatic charging rate (:math:`60 minutes / 15 minutes`, for
@@ -69,12 +71,19 @@ def bmxfc(greg, c_rate=4, loaded=0.8, full_output=False, **kwargs):
 
     Returns
     -------
-    soc : float
-        BMXFC value.
+    soc : float or numpy.ndarray
+        BMXFC value, an array with the broadcasted shape of the dict values
+        if some of them are arrays.
 
     res : dict, optional
         A dict present if `full_output=True` and described there.
 
+    Raises
+    ------
+    ValueError
+        If `full_output=True` and some of the dict values are arrays, since a
+        single regressor can not describe many materials.
+
     References
     ----------
     .. [2] F. Fernandez, E. M. Gavilán-Arriazu, D. E. Barraco, Y. Ein-Eli and
@@ -82,11 +91,25 @@ def bmxfc(greg, c_rate=4, loaded=0.8, full_output=False, **kwargs):
        Li-ion battery electrode materials." `Journal TODO`.
     """
     if isinstance(greg, dict):
-        greg_ = GalvanostaticRegressor(d=greg["d"], **kwargs)
+        d, dcoeff, k0 = (
+            np.asarray(greg[key], dtype=float)
+            for key in ("d", "dcoeff_", "k0_")
+        )
+
+        arrays = any(value.ndim > 0 for value in (d, dcoeff, k0))
+        if arrays and full_output:
+            raise ValueError(
+                "full_output=True is only available for scalar dict values."
+            )
+
+        greg_ = GalvanostaticRegressor(d=d, **kwargs)
         greg_._validate_geometry()
-        greg_._map = MapSpline(greg_.dataset)
-        greg_.dcoeff_, greg_.k0_ = greg["dcoeff_"], greg["k0_"]
+        greg_._map = MapSpline(greg_.dataset, degree=greg_.spline_degree)
+        greg_.dcoeff_, greg_.k0_ = dcoeff, k0
         greg_.dcoeff_err_ = None
+
+        if arrays:
+            return greg_._soc(c_rate, greg_.dcoeff_, greg_.k0_)
     else:
         greg_ = greg
 
@@ -108,16 +131,17 @@ def fom(d, dcoeff):
 
     Parameters
     ----------
-    d : float
+    d : float or array-like
         Geometric size in :math:`cm`.
 
-    dceoff : float
+    dceoff : float or array-like
         Diffusion coefficient in :math:`cm^2/s`.
 
     Returns
     -------
-    float
-        The FOM characteristic diffusion time (:math:`\tau`) value.
+    float or numpy.ndarray
+        The FOM characteristic diffusion time (:math:`\tau`) value, an array
+        with the broadcasted shape of the inputs if some of them are arrays.
 
     References
     ----------
@@ -125,4 +149,4 @@ def fom(d, dcoeff):
        fast-charging Li-ion battery materials." `ACS Nano, 16` (2022):
        8525-8530.
     """
-    return d**2 / dcoeff
+    return np.asarray(d) ** 2 / np.asarray(dcoeff)
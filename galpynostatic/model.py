@@ -18,14 +18,13 @@
 # IMPORTS
 # ============================================================================
 
-import itertools as it
+import joblib
 
 import numpy as np
 
 import pandas as pd
 
 from sklearn.base import BaseEstimator, RegressorMixin
-from sklearn.metrics import mean_squared_error as _skl_mse
 from sklearn.utils import validation as _skl_validation
 
 from .base import MapSpline
@@ -33,6 +32,16 @@ from .datasets import load_dataset
 from .plot import GalvanostaticPlotter
 from .utils import logell, logxi
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+#: Number of the best coarse grid points refined in the two stages search.
+COARSE_CANDIDATES = 5
+
+#: Half width, in coarse steps, of the window refined around each candidate.
+COARSE_WINDOW = 2
+
 # ============================================================================
 # CLASSES
 # ============================================================================
@@ -97,6 +106,29 @@ class GalvanostaticRegressor(BaseEstimator, RegressorMixin):
         Number of samples of kinetic rate constants to generate between the
         lower and the upper limit exponents.
 
+    coarse_step : int, default=1
+        If greater than 1, the grid search is performed in two stages. First,
+        a coarse grid is taken from the (D, k0) grid, keeping one out of every
+        `coarse_step` samples of each parameter. Then, the full resolution
+        grid is only evaluated in the windows of two coarse steps around each
+        of the five best coarse points. This reduces the number of
+        evaluations, but it may still miss the global minimum when the MSE
+        surface has several narrow local minima. If no coarse point has all
+        the C-rates inside the map, the whole grid is evaluated. The default
+        value of 1 means an exhaustive search of the whole grid.
+
+    n_jobs : int, default=None
+        Number of jobs to run in parallel the evaluation of the grid points,
+        which is split into blocks of diffusion coefficients and kinetic rate
+        constants combinations. ``None`` means 1 unless in a
+        ``joblib.parallel_backend`` context and ``-1`` means using all
+        processors.
+
+    spline_degree : int, default=3
+        Degree of the :ref:`galpynostatic.base` spline of the map. ``1`` uses
+        a bilinear interpolation that makes the grid search faster at the cost
+        of a less smooth map.
+
     Notes
     -----
     You can also give your own dataset to another potential cut-off in the
@@ -145,6 +177,9 @@ class GalvanostaticRegressor(BaseEstimator, RegressorMixin):
         k0_lle=-14,
         k0_ule=-5,
         k0_num=100,
+        coarse_step=1,
+        n_jobs=None,
+        spline_degree=3,
     ):
         self.dataset = dataset
         self.d = d
@@ -155,44 +190,167 @@ class GalvanostaticRegressor(BaseEstimator, RegressorMixin):
         self.k0_lle = k0_lle
         self.k0_ule = k0_ule
         self.k0_num = k0_num
+        self.coarse_step = coarse_step
+        self.n_jobs = n_jobs
+        self.spline_degree = spline_degree
 
     def _validate_geometry(self):
         """Validate geometry (when dataset is a string)."""
         if isinstance(self.dataset, str):
             self.dataset = load_dataset(geometry=self.dataset)
 
-    def _grid_points(self):
-        """Grid points (D, k0) to evaluate in the grid search."""
-        dcoeffs = np.logspace(
+    def _grid_axes(self):
+        """Log 10 axes of the (D, k0) grid to evaluate in the grid search.
+
+        The grid is logarithmically spaced, so the exponents are generated
+        directly instead of taking the logarithm of the parameters.
+        """
+        logdcoeffs = np.linspace(
             self.dcoeff_lle, self.dcoeff_ule, num=self.dcoeff_num
         )
-        k0s = np.logspace(self.k0_lle, self.k0_ule, num=self.k0_num)
-        return np.array(tuple(it.product(dcoeffs, k0s)))
+        logk0s = np.linspace(self.k0_lle, self.k0_ule, num=self.k0_num)
+        return logdcoeffs, logk0s
+
+    def _grid_logs(self, logcrates, logdcoeffs, logk0s):
+        """Log values of the internal parameters from broadcastable logs.
+
+        The log values of the internal parameters are separable in the
+        C-rates, D and k0, so they are built by broadcasting sums of the
+        logarithms of each axis instead of evaluating a logarithm for every
+        point of the (D, k0, C-rate) grid.
+        """
+        logells = (
+            logcrates + np.log10(self.d**2 / (3600 * self.z)) - logdcoeffs
+        )
+        logxis = logk0s + 0.5 * (
+            np.log10(3600 * self.z) - logcrates - logdcoeffs
+        )
+        return logells, logxis
+
+    def _grid_search(self, X, y, logdcoeffs, logk0s, sample_weight, mask=None):
+        """MSE of each (D, k0) point in the grid spanned by the log axes.
+
+        A point with any C-rate outside the map has an infinite MSE. Both log
+        parameters are monotone in the C-rate, so these points are found with
+        the extreme C-rates only and the map is just evaluated in the
+        remaining ones. If a boolean `mask` of the grid shape is given, the
+        points outside it are not evaluated either.
+        """
+        logcrates = np.log10(X.ravel())
+
+        grid = np.stack(
+            np.meshgrid(logdcoeffs, logk0s, indexing="ij"), axis=-1
+        )
+
+        logells, logxis = self._grid_logs(
+            np.array([logcrates.min(), logcrates.max()]),
+            grid[..., :1],
+            grid[..., 1:],
+        )
+        feasible = np.all(
+            self._map._mask_logell(logells) & self._map._mask_logxi(logxis),
+            axis=-1,
+        )
+        if mask is not None:
+            feasible &= mask
+
+        mse = np.full(feasible.shape, np.inf)
+        points = grid[feasible]
+        if points.size == 0:
+            return mse
+
+        blocks = np.array_split(points, joblib.effective_n_jobs(self.n_jobs))
+        socs = np.concatenate(
+            joblib.Parallel(n_jobs=self.n_jobs)(
+                joblib.delayed(self._map_soc)(
+                    *self._grid_logs(logcrates, block[:, :1], block[:, 1:])
+                )
+                for block in blocks
+            )
+        )
+
+        mse[feasible] = np.average(
+            (socs - y) ** 2, axis=-1, weights=sample_weight
+        )
+
+        return mse
 
-    def _calculate_uncertainties(self, X, y, attrs, delta):
-        """Uncertainties of `attrs` calculation.
+    def _coarse_mask(self, X, y, logdcoeffs, logk0s, sample_weight):
+        """Mask of the (D, k0) grid points to refine after a coarse search.
+
+        The MSE surface is a narrow valley, so the windows around several of
+        the best coarse points are refined instead of only the best one.
+        ``None`` is returned, meaning the whole grid, when no coarse point is
+        inside the map.
+        """
+        step = self.coarse_step
+        mse = self._grid_search(
+            X, y, logdcoeffs[::step], logk0s[::step], sample_weight
+        )
+
+        finite = np.flatnonzero(np.isfinite(mse))
+        if finite.size == 0:
+            return None
+
+        candidates = finite[np.argsort(mse.flat[finite])[:COARSE_CANDIDATES]]
+
+        mask = np.zeros((logdcoeffs.size, logk0s.size), dtype=bool)
+        for best in np.transpose(np.unravel_index(candidates, mse.shape)):
+            lower = np.maximum(step * (best - COARSE_WINDOW), 0)
+            upper = step * (best + COARSE_WINDOW) + 1
+            mask[tuple(map(slice, lower, upper))] = True
+
+        return mask
+
+    def _map_soc(self, logells, logxis):
+        """Maximum SOC values in the map for broadcastable log parameters.
+
+        Points outside the map are set to NaN and the spline is only
+        evaluated inside it.
+        """
+        logells, logxis = np.broadcast_arrays(logells, logxis)
+
+        mask = self._map._mask_logell(logells) & self._map._mask_logxi(logxis)
+
+        socs = np.full(mask.shape, np.nan)
+        socs[mask] = self._map.soc(logells[mask], logxis[mask])
+
+        return socs
+
+    def _soc(self, c_rates, dcoeff, k0):
+        """Maximum SOC values in the map for broadcastable parameters."""
+        return self._map_soc(
+            logell(c_rates, self.d, self.z, dcoeff),
+            logxi(c_rates, dcoeff, k0, self.z),
+        )
+
+    def _calculate_uncertainties(self, X, y, delta):
+        """Uncertainties of the fitted diffusion and kinetic parameters.
 
         The uncertainties are computed as the root squared values of the
         diagonal in the covariance matrix, which is approximated with the
         inverse of the Hessian matrix, calculated as the product of the
-        Jacobian matrix with its transpose.
+        Jacobian matrix with its transpose. The fitted parameters are passed
+        explicitly to the map evaluation, so they are not modified.
         """
-        jacobian = np.zeros((len(attrs), len(y)))
-        for i, attr in enumerate(attrs):
-            param = self.__dict__[attr]
+        c_rates = X.ravel()
+        params = np.array([self.dcoeff_, self.k0_])
 
-            self.__dict__[attr] = (1 + delta) * param
-            upper = self.predict(X)
+        jacobian = np.zeros((params.size, len(y)))
+        for i, param in enumerate(params):
+            upper, lower = params.copy(), params.copy()
+            upper[i], lower[i] = (1 + delta) * param, (1 - delta) * param
 
-            self.__dict__[attr] = (1 - delta) * param
-            lower = self.predict(X)
-
-            jacobian[i] = (upper - lower) / (2 * delta * param)
+            jacobian[i] = (
+                self._soc(c_rates, *upper) - self._soc(c_rates, *lower)
+            ) / (2 * delta * param)
 
         hessian = np.dot(jacobian, jacobian.T)
         covariance = np.linalg.inv(hessian)
 
-        stdsq = np.sum((y - self.predict(X)) ** 2) / (len(y) - len(attrs))
+        stdsq = np.sum((y - self._soc(c_rates, *params)) ** 2) / (
+            len(y) - params.size
+        )
 
         return stdsq * np.sqrt(np.diag(covariance))
 
@@ -224,26 +382,27 @@ class GalvanostaticRegressor(BaseEstimator, RegressorMixin):
         X, y = _skl_validation.check_X_y(X, y)
         self._validate_geometry()
 
-        self._map = MapSpline(self.dataset)
+        self._map = MapSpline(self.dataset, degree=self.spline_degree)
 
-        params = self._grid_points()
+        logdcoeffs, logk0s = self._grid_axes()
 
-        mse = np.full(params.shape[0], np.inf)
-        for k, (self.dcoeff_, self.k0_) in enumerate(params):
-            try:
-                mse[k] = _skl_mse(
-                    y, self.predict(X), sample_weight=sample_weight
-                )
-            except ValueError:
-                ...
+        mask = (
+            self._coarse_mask(X, y, logdcoeffs, logk0s, sample_weight)
+            if self.coarse_step > 1
+            else None
+        )
+
+        mse = self._grid_search(
+            X, y, logdcoeffs, logk0s, sample_weight, mask=mask
+        )
 
-        idx = np.argmin(mse)
-        self.mse_ = mse[idx]
+        i, j = np.unravel_index(np.argmin(mse), mse.shape)
+        self.mse_ = mse[i, j]
 
-        self.dcoeff_, self.k0_ = params[idx]
+        self.dcoeff_, self.k0_ = 10.0 ** logdcoeffs[i], 10.0 ** logk0s[j]
 
         self.dcoeff_err_, self.k0_err_ = self._calculate_uncertainties(
-            X, y, ("dcoeff_", "k0_"), np.cbrt(np.finfo(float).eps)
+            X, y, np.cbrt(np.finfo(float).eps)
         )
 
         return self
@@ -264,15 +423,7 @@ class GalvanostaticRegressor(BaseEstimator, RegressorMixin):
         _skl_validation.check_is_fitted(self)
         X = _skl_validation.check_array(X)
 
-        logells = logell(X.ravel(), self.d, self.z, self.dcoeff_)
-        logxis = logxi(X.ravel(), self.dcoeff_, self.k0_, self.z)
-
-        mask_logell = self._map._mask_logell(logells)
-        mask_logxi = self._map._mask_logxi(logxis)
-
-        return np.where(
-            mask_logell & mask_logxi, self._map.soc(logells, logxis), np.nan
-        )
+        return self._soc(X.ravel(), self.dcoeff_, self.k0_)
 
     def score(self, X, y, sample_weight=None):
         r"""Return the coefficient of determination of the prediction.
@@ -75,29 +75,15 @@ class GalvanostaticPlotter:
         """
         ax = plt.gca() if ax is None else ax
 
-        logelleval = np.linspace(
-            np.min(self.greg._map.logells_),
-            np.max(self.greg._map.logells_),
-            num=1000,
-        )
-        logxieval = np.linspace(
-            np.min(self.greg._map.logxis_),
-            np.max(self.greg._map.logxis_),
-            num=1000,
-        )
+        logells, logxis = self.greg._map.logells_, self.greg._map.logxis_
+        extent = [logells[0], logells[-1], logxis[0], logxis[-1]]
+
+        logelleval = np.linspace(*extent[:2], num=1000)
+        logxieval = np.linspace(*extent[2:], num=1000)
 
         z = self.greg._map.soc(logelleval, logxieval, grid=True)
 
-        im = ax.imshow(
-            z.T,
-            extent=[
-                logelleval.min(),
-                logelleval.max(),
-                logxieval.min(),
-                logxieval.max(),
-            ],
-            origin="lower",
-        )
+        im = ax.imshow(z.T, extent=extent, origin="lower")
 
         if clb:
             clb = plt.colorbar(im)
@@ -83,7 +83,9 @@ def logxi(c_rate, dcoeff, k0, z):
     logxi : float or array-like
         The log 10 value of :math:`\Xi` internal parameter.
     """
-    return np.log10(k0 * np.sqrt(3600 * z / (np.asarray(c_rate) * dcoeff)))
+    return np.log10(k0) + 0.5 * np.log10(
+        3600 * z / (np.asarray(c_rate) * dcoeff)
+    )
 
 
 def logcrate(xi_log, dcoeff, k0, z):
@@ -61,8 +61,8 @@ def nishikawa():
             ),
             "dcoeff": 1.0e-9,
             "k0": 1.0e-6,
-            "dcoeff_err": 1.392838e-10,
-            "k0_err": 1.076618e-06,
+            "dcoeff_err": 1.392771e-10,
+            "k0_err": 1.076565e-06,
             "mse": 0.0029335,
             "soc": np.array(
                 [0.941998, 0.886919, 0.831773, 0.722105, 0.464918]
@@ -71,7 +71,7 @@ def nishikawa():
             "c_rate": 8.942052,
             "c_rate_err": 0.003725,
             "particle_size": 12.180608,
-            "particle_size_err": 0.848281,
+            "particle_size_err": 0.848240,
         },
     }
 
@@ -105,8 +105,8 @@ def mancini():
             "dc": None,
             "dcoeff": 1.0e-10,
             "k0": 1.0e-6,
-            "dcoeff_err": 3.755249e-13,
-            "k0_err": 1.666335e-07,
+            "dcoeff_err": 3.500881e-13,
+            "k0_err": 1.666222e-07,
             "mse": 0.0006329,
             "soc": np.array(
                 [
@@ -125,7 +125,7 @@ def mancini():
             "c_rate": 1.122309,
             "c_rate_err": 0.000204,
             "particle_size": 3.950719,
-            "particle_size_err": 0.007418,
+            "particle_size_err": 0.006915,
         },
     }
 
@@ -147,8 +147,8 @@ def he():
             ),
             "dcoeff": 1.0e-11,
             "k0": 1.0e-8,
-            "dcoeff_err": 4.745976e-13,
-            "k0_err": 7.622031e-10,
+            "dcoeff_err": 4.745859e-13,
+            "k0_err": 7.621822e-10,
             "mse": 0.0010655,
             "soc": np.array(
                 [0.982609, 0.924677, 0.852255, 0.707423, 0.312355]
@@ -188,8 +188,8 @@ def wang():
             ),
             "dcoeff": 1.0e-8,
             "k0": 1.0e-6,
-            "dcoeff_err": 1.835289e-08,
-            "k0_err": 3.875681e-06,
+            "dcoeff_err": 1.835341e-08,
+            "k0_err": 3.875790e-06,
             "mse": 0.002888,
             "soc": np.array(
                 [0.988041, 0.979001, 0.960908, 0.906617, 0.816162, 0.635376]
@@ -198,7 +198,7 @@ def wang():
             "c_rate": 10.894016,
             "c_rate_err": 0.015179,
             "particle_size": 35.571076,
-            "particle_size_err": 32.641602,
+            "particle_size_err": 32.642527,
         },
     }
 
@@ -236,8 +236,8 @@ def lei():
             ),
             "dcoeff": 1.0e-13,
             "k0": 1.0e-8,
-            "dcoeff_err": 2.834146e-15,
-            "k0_err": 6.4625e-09,
+            "dcoeff_err": 2.917771e-15,
+            "k0_err": 6.462353e-09,
             "mse": 0.006013,
             "soc": np.array(
                 [0.987526, 0.973163, 0.949237, 0.901407, 0.757801, 0.523202]
@@ -246,7 +246,7 @@ def lei():
             "c_rate": 4.117637,
             "c_rate_err": 0.000151,
             "particle_size": 0.35571,
-            "particle_size_err": 0.000504,
+            "particle_size_err": 0.000519,
         },
     }
 
@@ -284,8 +284,8 @@ def bak():
             ),
             "dcoeff": 9.999939e-13,
             "k0": 9.999939e-10,
-            "dcoeff_err": 4.023782e-13,
-            "k0_err": 3.359260e-11,
+            "dcoeff_err": 4.023568e-13,
+            "k0_err": 3.359069e-11,
             "mse": 0.0054603,
             "soc": np.array(
                 [0.989701, 0.96014, 0.923195, 0.849311, 0.627971, 0.258862]
@@ -294,7 +294,7 @@ def bak():
             "c_rate": 26.674768,
             "c_rate_err": 3.846772e-05,
             "particle_size": 0.147765,
-            "particle_size_err": 0.029729,
+            "particle_size_err": 0.029727,
         },
     }
 
@@ -314,8 +314,8 @@ def dokko():
             "dc": None,
             "dcoeff": 1.0e-9,
             "k0": 1.0e-6,
-            "dcoeff_err": 1.082707e-10,
-            "k0_err": 6.288231e-07,
+            "dcoeff_err": 1.082684e-10,
+            "k0_err": 6.288067e-07,
             "mse": 0.0201603,
             "soc": np.array(
                 [
@@ -332,6 +332,6 @@ def dokko():
             "c_rate": 7.146494,
             "c_rate_err": 0.001948,
             "particle_size": 12.180608,
-            "particle_size_err": 0.659401,
+            "particle_size_err": 0.659387,
         },
     }
@@ -16,6 +16,8 @@ import galpynostatic.base
 
 import numpy as np
 
+import pandas as pd
+
 import pytest
 
 # =============================================================================
@@ -60,3 +62,58 @@ def test_map_spline_masks(param, spherical):
     )
 
     np.testing.assert_equal(res, [False, True, False])
+
+
+def test_map_spline_cache(spherical):
+    """Test that equal datasets share the spline and different do not."""
+    ms = galpynostatic.base.MapSpline(spherical)
+
+    assert galpynostatic.base.MapSpline(spherical.copy()).spline_ is ms.spline_
+
+    modified = spherical.copy()
+    modified["xmax"] = 0.5 * modified["xmax"]
+
+    assert galpynostatic.base.MapSpline(modified).spline_ is not ms.spline_
+
+
+def test_map_spline_degree(spherical):
+    """Test that the bilinear map spline interpolates the dataset."""
+    ms = galpynostatic.base.MapSpline(spherical, degree=1)
+
+    res = ms.soc(spherical.l.to_numpy(), spherical.xi.to_numpy())
+
+    np.testing.assert_array_almost_equal(res, spherical.xmax, 6)
+    np.testing.assert_array_almost_equal(
+        ms.soc(-3.95, 2.0), np.mean(ms.soc([-4.0, -3.9], 2.0)), 6
+    )
+
+
+def test_map_spline_dtypes(spherical):
+    """Test map datasets that are not stored as float64."""
+    ms = galpynostatic.base.MapSpline(spherical.astype(np.float32))
+
+    np.testing.assert_almost_equal(ms.soc(-4.0, 2.0), 0.99706, 6)
+
+    logells, logxis = np.meshgrid(
+        np.arange(5), np.arange(4)[::-1], indexing="ij"
+    )
+    integers = pd.DataFrame(
+        {
+            "l": logells.ravel(),
+            "xi": logxis.ravel(),
+            "xmax": 1 / (1 + np.exp(logells - logxis)).ravel(),
+        }
+    )
+    ms = galpynostatic.base.MapSpline(integers)
+
+    np.testing.assert_array_almost_equal(
+        ms.soc(integers.l, integers.xi), integers.xmax, 6
+    )
+
+
+def test_map_spline_scalar(spherical):
+    """Test that a scalar query returns a scalar."""
+    ms = galpynostatic.base.MapSpline(spherical)
+
+    assert np.ndim(ms.soc(-4.0, 2.0)) == 0
+    assert isinstance(ms.soc(-4.0, 2.0), np.float64)
@@ -281,3 +281,13 @@ def test_value_error():
     """Test the raise of the ValueError."""
     with pytest.raises(ValueError):
         galpynostatic.datasets.load_dataset(geometry="plane")
+
+
+def test_dataset_is_a_copy():
+    """Test that modifying a loaded dataset does not change the next one."""
+    dataset = galpynostatic.datasets.load_dataset()
+    dataset["xmax"] = 0.0
+
+    np.testing.assert_almost_equal(
+        galpynostatic.datasets.load_dataset().xmax.max(), 0.99706, 6
+    )
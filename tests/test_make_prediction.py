@@ -86,6 +86,36 @@ def test_optimal_charging_rate_err(experiment, request, spherical):
     )
 
 
+@pytest.mark.parametrize(
+    ("experiment"),
+    [
+        ("nishikawa"),
+        ("mancini"),
+        ("he"),
+        ("wang"),
+        ("lei"),
+        ("bak"),
+        ("dokko"),
+    ],
+)
+def test_optimal_charging_rate_brentq(experiment, request, spherical):
+    """Test the prediction of the optimal C-rate with brentq."""
+    experiment = request.getfixturevalue(experiment)
+
+    greg = galpynostatic.model.GalvanostaticRegressor(d=experiment["d"], z=3)
+    greg.dcoeff_, greg.k0_ = experiment["dcoeff"], experiment["k0"]
+    greg._map = galpynostatic.base.MapSpline(spherical)
+    greg.dcoeff_err_, greg.k0_err_ = None, None
+
+    c_rate = galpynostatic.make_prediction.optimal_charging_rate(
+        greg, method="brentq"
+    )
+
+    np.testing.assert_array_almost_equal(
+        c_rate, experiment["ref"]["c_rate"], 6
+    )
+
+
 def test_raise_optimal_charging_rate(spherical):
     """Test the raise of the ValueError."""
     greg = galpynostatic.model.GalvanostaticRegressor(d=0.0015, z=3)
@@ -98,6 +128,18 @@ def test_raise_optimal_charging_rate(spherical):
         )
 
 
+def test_raise_optimal_charging_rate_method(spherical):
+    """Test the raise of the ValueError with an invalid method."""
+    greg = galpynostatic.model.GalvanostaticRegressor(d=0.0015, z=3)
+    greg.dcoeff_, greg.k0_ = 1.93e-10, 3.14e-7
+    greg._map = galpynostatic.base.MapSpline(spherical)
+
+    with pytest.raises(ValueError):
+        galpynostatic.make_prediction.optimal_charging_rate(
+            greg, method="bisect"
+        )
+
+
 @pytest.mark.parametrize(
     ("experiment"),
     [
@@ -126,6 +168,7 @@ def test_optimal_particle_size(experiment, request, spherical):
     np.testing.assert_array_almost_equal(
         size, experiment["ref"]["particle_size"], 6
     )
+    assert greg.d == experiment["d"]
 
 
 @pytest.mark.parametrize(
@@ -161,6 +204,36 @@ def test_optimal_particle_size_err(experiment, request, spherical):
     )
 
 
+@pytest.mark.parametrize(
+    ("experiment"),
+    [
+        ("nishikawa"),
+        ("mancini"),
+        ("he"),
+        ("wang"),
+        ("lei"),
+        ("bak"),
+        ("dokko"),
+    ],
+)
+def test_optimal_particle_size_brentq(experiment, request, spherical):
+    """Test the prediction of the optimal particle size with brentq."""
+    experiment = request.getfixturevalue(experiment)
+
+    greg = galpynostatic.model.GalvanostaticRegressor(d=experiment["d"], z=3)
+    greg.dcoeff_, greg.k0_ = experiment["dcoeff"], experiment["k0"]
+    greg._map = galpynostatic.base.MapSpline(spherical)
+    greg.dcoeff_err_ = None
+
+    size = galpynostatic.make_prediction.optimal_particle_size(
+        greg, method="brentq"
+    )
+
+    np.testing.assert_array_almost_equal(
+        size, experiment["ref"]["particle_size"], 6
+    )
+
+
 def test_raise_optimal_particle_size(spherical):
     """Test the raise of the ValueError."""
     greg = galpynostatic.model.GalvanostaticRegressor(d=0.0015, z=3)
@@ -171,3 +244,15 @@ def test_raise_optimal_particle_size(spherical):
         galpynostatic.make_prediction.optimal_particle_size(
             greg, c_rate=60, loaded=1
         )
+
+
+def test_raise_optimal_particle_size_method(spherical):
+    """Test the raise of the ValueError with an invalid method."""
+    greg = galpynostatic.model.GalvanostaticRegressor(d=0.0015, z=3)
+    greg.dcoeff_, greg.k0_ = 1.93e-10, 3.14e-7
+    greg._map = galpynostatic.base.MapSpline(spherical)
+
+    with pytest.raises(ValueError):
+        galpynostatic.make_prediction.optimal_particle_size(
+            greg, method="bisect"
+        )
@@ -87,3 +87,70 @@ class TestMetric:
         value = galpynostatic.metric.bmxfc(greg)
 
         np.testing.assert_almost_equal(value, ref[0], 6)
+
+
+def test_bmxfc_fit_arrays():
+    """Test the BMXFC metric for many materials at once."""
+    greg = {
+        "d": 1e-4 * np.array([10.0, 8.0, 3.5, 7.5]),
+        "dcoeff_": np.array([7.8e-11, 3.324154e-10, 1.732051e-11, 1.0e-09]),
+        "k0_": 1e-7,
+    }
+
+    values = galpynostatic.metric.bmxfc(greg)
+
+    np.testing.assert_array_almost_equal(
+        values, [0.1246232, 0.6676308, 0.2758745, 0.8413092], 6
+    )
+
+
+def test_bmxfc_fit_lists():
+    """Test the BMXFC metric for many materials given as lists."""
+    greg = {
+        "d": [1e-3, 8e-4, 3.5e-4, 7.5e-4],
+        "dcoeff_": [7.8e-11, 3.324154e-10, 1.732051e-11, 1.0e-09],
+        "k0_": 1e-7,
+    }
+
+    values = galpynostatic.metric.bmxfc(greg)
+
+    np.testing.assert_array_almost_equal(
+        values, [0.1246232, 0.6676308, 0.2758745, 0.8413092], 6
+    )
+
+
+def test_fom_arrays():
+    """Test the Figure of Merit for many materials at once."""
+    values = galpynostatic.metric.fom(
+        1e-4 * np.array([10.0, 8.0, 3.5]),
+        [7.8e-11, 3.324154e-10, 1.732051e-11],
+    )
+
+    np.testing.assert_array_almost_equal(
+        values, [12820.512821, 1925.301896, 7072.540012], 6
+    )
+
+
+def test_bmxfc_fit_independent_greg():
+    """Test that each BMXFC call returns a regressor with its own map."""
+    greg = {"d": 1e-3, "dcoeff_": 7.8e-11, "k0_": 1e-7}
+
+    res = galpynostatic.metric.bmxfc(greg, full_output=True)
+    res["greg"]._map.logells_ = res["greg"]._map.logells_ + 1.0
+
+    other = galpynostatic.metric.bmxfc(greg, full_output=True)
+
+    assert other["greg"]._map is not res["greg"]._map
+    np.testing.assert_almost_equal(other["soc"], 0.1246232, 6)
+
+
+def test_raise_bmxfc_fit_arrays_full_output():
+    """Test the raise of the ValueError with arrays and full output."""
+    greg = {
+        "d": 1e-4 * np.array([10.0, 8.0]),
+        "dcoeff_": np.array([7.8e-11, 3.324154e-10]),
+        "k0_": 1e-7,
+    }
+
+    with pytest.raises(ValueError):
+        galpynostatic.metric.bmxfc(greg, full_output=True)
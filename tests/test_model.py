@@ -139,6 +139,90 @@ class TestModel:
         pd.testing.assert_frame_equal(df, df_ref)
 
 
+def test_fit_n_jobs(nishikawa, spherical):
+    """Test that the parallel grid search gives the same fitted model."""
+    kwargs = {
+        "dataset": spherical,
+        "d": nishikawa["d"],
+        "z": 3,
+        "dcoeff_lle": -14,
+        "dcoeff_ule": -7,
+        "k0_lle": -13,
+        "k0_ule": -6,
+        "dcoeff_num": 8,
+        "k0_num": 8,
+    }
+
+    greg = galpynostatic.model.GalvanostaticRegressor(**kwargs)
+    greg = greg.fit(nishikawa["C_rates"], nishikawa["soc"])
+
+    greg_par = galpynostatic.model.GalvanostaticRegressor(n_jobs=2, **kwargs)
+    greg_par = greg_par.fit(nishikawa["C_rates"], nishikawa["soc"])
+
+    np.testing.assert_almost_equal(greg_par.dcoeff_, greg.dcoeff_, 13)
+    np.testing.assert_almost_equal(greg_par.k0_, greg.k0_, 11)
+    np.testing.assert_almost_equal(greg_par.mse_, greg.mse_, 6)
+
+
+@pytest.mark.parametrize(
+    ("experiment"),
+    [
+        ("nishikawa"),
+        ("mancini"),
+        ("he"),
+        ("wang"),
+        ("lei"),
+        ("bak"),
+        ("dokko"),
+    ],
+)
+def test_fit_coarse_step(experiment, request, spherical):
+    """Test that the two stages grid search finds the same minimum."""
+    experiment = request.getfixturevalue(experiment)
+
+    greg = galpynostatic.model.GalvanostaticRegressor(
+        dataset=spherical, d=experiment["d"], z=3
+    )
+    greg = greg.fit(experiment["C_rates"], experiment["soc"])
+
+    greg_coarse = galpynostatic.model.GalvanostaticRegressor(
+        dataset=spherical, d=experiment["d"], z=3, coarse_step=5
+    )
+    greg_coarse = greg_coarse.fit(experiment["C_rates"], experiment["soc"])
+
+    assert greg_coarse.dcoeff_ == greg.dcoeff_
+    assert greg_coarse.k0_ == greg.k0_
+    assert greg_coarse.mse_ == greg.mse_
+
+
+def test_fit_coarse_step_outside(nishikawa, spherical):
+    """Test the exhaustive search when the coarse grid is outside the map."""
+    kwargs = {
+        "dataset": spherical,
+        "d": nishikawa["d"],
+        "z": 3,
+        "dcoeff_lle": -11.75,
+        "dcoeff_ule": -9.75,
+        "dcoeff_num": 21,
+        "k0_lle": -11.75,
+        "k0_ule": -9.75,
+        "k0_num": 21,
+    }
+
+    greg = galpynostatic.model.GalvanostaticRegressor(**kwargs)
+    greg = greg.fit(nishikawa["C_rates"], nishikawa["soc"])
+
+    greg_coarse = galpynostatic.model.GalvanostaticRegressor(
+        coarse_step=10, **kwargs
+    )
+    greg_coarse = greg_coarse.fit(nishikawa["C_rates"], nishikawa["soc"])
+
+    assert np.isfinite(greg.mse_)
+    assert greg_coarse.dcoeff_ == greg.dcoeff_
+    assert greg_coarse.k0_ == greg.k0_
+    assert greg_coarse.mse_ == greg.mse_
+
+
 def test_raise():
     """Test the raise of the ValueError."""
     greg = galpynostatic.model.GalvanostaticRegressor("spherica", 1.0, 3)